@@ -1,34 +1,81 @@
 """LangChain integration for Axiora — Japanese financial data API."""
 
+from __future__ import annotations
+
+from importlib import import_module
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 from langchain_axiora.api_wrapper import AxioraAPIWrapper
-from langchain_axiora.retriever import AxioraRetriever
-from langchain_axiora.toolkit import AxioraToolkit
-from langchain_axiora.tools import (
-    ALL_TOOLS,
-    CompareCompaniesTool,
-    GetCompanyTool,
-    GetCoverageTool,
-    GetFilingCalendarTool,
-    GetFinancialsTool,
-    GetGrowthTool,
-    GetHealthRankingTool,
-    GetHealthScoreTool,
-    GetPeersTool,
-    GetRankingTool,
-    GetSectorOverviewTool,
-    GetTimeseriesTool,
-    GetTranslationsTool,
-    ListFilingsTool,
-    ScreenCompaniesTool,
-    SearchCompaniesBatchTool,
-    SearchCompaniesTool,
-    SearchTranslationsTool,
-)
+
+if TYPE_CHECKING:
+    from langchain_axiora.retriever import AxioraRetriever
+    from langchain_axiora.toolkit import AxioraToolkit, make_shared
+    from langchain_axiora.tools import (
+        ALL_TOOLS,
+        CompareCompaniesTool,
+        GetCompanyTool,
+        GetCoverageTool,
+        GetFilingCalendarTool,
+        GetFinancialsTool,
+        GetGrowthTool,
+        GetHealthRankingTool,
+        GetHealthScoreTool,
+        GetPeersTool,
+        GetRankingTool,
+        GetSectorOverviewTool,
+        GetTimeseriesTool,
+        GetTranslationsTool,
+        ListFilingsTool,
+        ScreenCompaniesTool,
+        SearchCompaniesBatchTool,
+        SearchCompaniesTool,
+        SearchTranslationsTool,
+    )
 
 __version__ = version("langchain-axiora")
 
+# Everything except the API wrapper is imported on first attribute access, so
+# code that only needs the HTTP client doesn't build all the tool models.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AxioraRetriever": "retriever",
+    "AxioraToolkit": "toolkit",
+    "make_shared": "toolkit",
+    "ALL_TOOLS": "tools",
+    "CompareCompaniesTool": "tools",
+    "GetCompanyTool": "tools",
+    "GetCoverageTool": "tools",
+    "GetFilingCalendarTool": "tools",
+    "GetFinancialsTool": "tools",
+    "GetGrowthTool": "tools",
+    "GetHealthRankingTool": "tools",
+    "GetHealthScoreTool": "tools",
+    "GetPeersTool": "tools",
+    "GetRankingTool": "tools",
+    "GetSectorOverviewTool": "tools",
+    "GetTimeseriesTool": "tools",
+    "GetTranslationsTool": "tools",
+    "ListFilingsTool": "tools",
+    "ScreenCompaniesTool": "tools",
+    "SearchCompaniesBatchTool": "tools",
+    "SearchCompaniesTool": "tools",
+    "SearchTranslationsTool": "tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "ALL_TOOLS",
     "AxioraAPIWrapper",
@@ -52,4 +99,5 @@ __all__ = [
     "SearchCompaniesBatchTool",
     "SearchCompaniesTool",
     "SearchTranslationsTool",
+    "make_shared",
 ]
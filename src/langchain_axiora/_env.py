@@ -0,0 +1,15 @@
+"""Configuration defaults shared by the wrapper, toolkit and retriever."""
+
+from __future__ import annotations
+
+from langchain_core.utils import secret_from_env
+
+DEFAULT_BASE_URL = "https://api.axiora.dev/v1"
+
+_AXIORA_KEY_FACTORY = secret_from_env(
+    "AXIORA_API_KEY",
+    error_message=(
+        "Axiora API key not found. Set the AXIORA_API_KEY environment variable "
+        "or pass api_key= to the constructor."
+    ),
+)
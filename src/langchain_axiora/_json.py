@@ -0,0 +1,28 @@
+"""JSON encoding and decoding that use ``orjson`` when it is available."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # e.g. PyPy, where orjson has no wheels
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document, preferring orjson's native parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> str:
+    """Serialize ``data`` to compact UTF-8 JSON, stringifying unknown types."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib handles those
+    return json.dumps(data, ensure_ascii=False, default=str, separators=(",", ":"))
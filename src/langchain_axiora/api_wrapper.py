@@ -2,79 +2,441 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import contextlib
+import hashlib
+import threading
+import weakref
+from functools import cached_property
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from langchain_core.utils import secret_from_env
 from pydantic import BaseModel, Field, PrivateAttr, SecretStr
 
-DEFAULT_BASE_URL = "https://api.axiora.dev/v1"
+from langchain_axiora import _json
+from langchain_axiora._cache import MISSING, TTLCache
+from langchain_axiora._env import _AXIORA_KEY_FACTORY, DEFAULT_BASE_URL
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Hashable,
+        Iterator,
+        Sequence,
+    )
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # optional: pip install langchain-axiora[stream]
+    ijson = None
+
+_USER_AGENT = f"langchain-axiora/{version('langchain-axiora')}"
+
+# Agents fire many tool calls in parallel; keep enough warm connections around
+# that bursts don't pay a fresh TCP + TLS handshake per request.
+_LIMITS = httpx.Limits(
+    max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+_RETRIES = 1
+
+# (method, path, params) — one API call in a fan-out.
+_Call = tuple[str, str, "dict[str, Any] | None"]
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _retrieve_exception(task: asyncio.Future[Any]) -> None:
+    # Every waiter may have been cancelled; mark a failure as seen so asyncio doesn't log it.
+    if not task.cancelled():
+        task.exception()
+
+
+def _items_at(body: Any, prefix: str) -> Iterator[Any]:
+    """Yield what ``ijson.items(body, prefix)`` would from an already-parsed body."""
+    nodes = [body]
+    for key in prefix.split(".") if prefix else ():
+        if key == "item":
+            nodes = [child for node in nodes if isinstance(node, list) for child in node]
+        else:
+            nodes = [node[key] for node in nodes if isinstance(node, dict) and key in node]
+    yield from nodes
 
 
 class AxioraAPIWrapper(BaseModel):
     """Shared HTTP client used by all Axiora LangChain tools.
 
     Reuses connections via persistent httpx clients for better performance.
+    HTTP/2 is negotiated by default so concurrent calls multiplex over one
+    connection; pass ``http2=False`` to force HTTP/1.1.
+    Successful GET responses are cached in memory for ``cache_ttl`` seconds
+    (``0`` disables caching). The raw bytes are cached and decoded per call,
+    so every caller gets its own copy of the body. Tools keep their
+    formatted results in the same cache.
+    The async client's pooled connections belong to the event loop that opened
+    them, so each running loop (e.g. a second ``asyncio.run``, or a loop in
+    another thread) gets its own async client.
+    ``transport`` replaces the pooled network transport, e.g. with an
+    ``httpx.MockTransport`` in tests; it backs whichever client (sync or
+    async) it implements.
     """
 
     api_key: SecretStr = Field(
         alias="api_key",
-        default_factory=secret_from_env(
-            "AXIORA_API_KEY",
-            error_message=(
-                "Axiora API key not found. Set the AXIORA_API_KEY environment variable "
-                "or pass api_key= to the constructor."
-            ),
-        ),
+        default_factory=_AXIORA_KEY_FACTORY,
     )
     base_url: str = Field(default=DEFAULT_BASE_URL)
     timeout: float = Field(default=30.0)
+    http2: bool = Field(default=True)
+    cache_ttl: float = Field(default=60.0)
+    cache_max: int = Field(default=1024)
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = Field(
+        default=None, exclude=True, repr=False
+    )
 
     _sync_client: httpx.Client | None = PrivateAttr(default=None)
+    # Created outside any loop; adopted by the first loop that uses it.
     _async_client: httpx.AsyncClient | None = PrivateAttr(default=None)
+    _async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+        PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    )
+    _async_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _base_url: str = PrivateAttr(default="")
+    _cache: TTLCache | None = PrivateAttr(default=None)
+    _inflight: dict[Hashable, asyncio.Future[Any]] = PrivateAttr(default_factory=dict)
 
     model_config = {"arbitrary_types_allowed": True, "populate_by_name": True}
 
-    def _headers(self) -> dict[str, str]:
-        from langchain_axiora import __version__
+    def model_post_init(self, __context: Any) -> None:
+        self._base_url = self.base_url.rstrip("/")
+        if self.cache_ttl > 0:
+            self._cache = TTLCache(maxsize=self.cache_max, ttl=self.cache_ttl)
+
+    @cached_property
+    def _identity(self) -> tuple[str, str]:
+        return _credential_key(self.api_key, self.base_url)
 
+    @cached_property
+    def _headers(self) -> dict[str, str]:
         return {
             "Authorization": f"Bearer {self.api_key.get_secret_value()}",
-            "User-Agent": f"langchain-axiora/{__version__}",
+            "User-Agent": _USER_AGENT,
             "Accept": "application/json",
         }
 
-    def _clean(self, params: dict[str, Any]) -> dict[str, Any]:
-        return {k: v for k, v in params.items() if v is not None}
+    def _clean(self, params: dict[str, Any]) -> list[tuple[str, Any]]:
+        # httpx takes a list of pairs as-is, so no intermediate dict is built.
+        return [(k, v) for k, v in params.items() if v is not None]
+
+    def _cache_key(
+        self, method: str, path: str, query: list[tuple[str, Any]]
+    ) -> Hashable | None:
+        if self._cache is None or method.upper() != "GET":
+            return None
+        items = ((k, tuple(v) if isinstance(v, list) else v) for k, v in query)
+        return (path, tuple(sorted(items)))
+
+    def clear_cache(self) -> None:
+        """Drop every cached response, including tool results built on this wrapper."""
+        if self._cache is not None:
+            self._cache.clear()
 
     @property
     def sync_client(self) -> httpx.Client:
         if self._sync_client is None:
+            transport = self.transport
+            if not isinstance(transport, httpx.BaseTransport):
+                transport = httpx.HTTPTransport(
+                    limits=_LIMITS, http2=self.http2, retries=_RETRIES
+                )
             self._sync_client = httpx.Client(
-                headers=self._headers(), timeout=self.timeout
+                base_url=self._base_url,
+                headers=self._headers,
+                timeout=self.timeout,
+                transport=transport,
             )
         return self._sync_client
 
     @property
     def async_client(self) -> httpx.AsyncClient:
-        if self._async_client is None:
-            self._async_client = httpx.AsyncClient(
-                headers=self._headers(), timeout=self.timeout
-            )
-        return self._async_client
+        loop = _running_loop()
+        if loop is None:
+            if self._async_client is None:
+                self._async_client = self._new_async_client()
+            return self._async_client
+        client = self._async_clients.get(loop)
+        if client is None:
+            with self._async_lock:
+                # Clients of closed loops can't be reused or awaited closed; let them go.
+                for stale in [other for other in self._async_clients if other.is_closed()]:
+                    del self._async_clients[stale]
+                client = self._async_client or self._new_async_client()
+                self._async_client = None
+                self._async_clients[loop] = client
+        return client
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        transport = self.transport
+        if not isinstance(transport, httpx.AsyncBaseTransport):
+            transport = httpx.AsyncHTTPTransport(limits=_LIMITS, http2=self.http2, retries=_RETRIES)
+        return httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._headers,
+            timeout=self.timeout,
+            transport=transport,
+        )
+
+    async def warmup(self) -> None:
+        """Open a pooled connection ahead of the first real request.
+
+        Failures are ignored — a cold pool just means the next call connects itself.
+        """
+        with contextlib.suppress(httpx.HTTPError):
+            await self.async_client.get("/health")
+
+    def close(self) -> None:
+        """Close the synchronous client and release its connection pool."""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and the sync client.
+
+        Async clients belonging to other, still-running loops are left to those loops.
+        """
+        loop = asyncio.get_running_loop()
+        for client in (self._async_clients.pop(loop, None), self._async_client):
+            if client is not None:
+                await client.aclose()
+        self._async_client = None
+        self.close()
+
+    def __enter__(self) -> AxioraAPIWrapper:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> AxioraAPIWrapper:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     def request(self, method: str, path: str, params: dict[str, Any] | None = None) -> Any:
         """Synchronous API request. Returns the JSON body."""
-        url = f"{self.base_url.rstrip('/')}{path}"
-        resp = self.sync_client.request(method, url, params=self._clean(params or {}))
-        resp.raise_for_status()
-        return resp.json()
+        query = self._clean(params or {})
+        key = self._cache_key(method, path, query)
+        if key is not None:
+            cached = self._cache.get(key)  # type: ignore[union-attr]
+            if cached is not MISSING:
+                return _json.loads(cached)
+        content = self._fetch(method, path, query)
+        if key is not None:
+            self._cache.set(key, content)  # type: ignore[union-attr]
+        return _json.loads(content)
+
+    def _fetch(self, method: str, path: str, query: list[tuple[str, Any]]) -> bytes:
+        """Send one request, bypassing the cache. Returns the raw body."""
+        resp = self.sync_client.request(method, path, params=query)
+        if not 200 <= resp.status_code < 300:  # only pay for raise_for_status() on errors
+            resp.raise_for_status()
+        return resp.content
 
     async def arequest(
         self, method: str, path: str, params: dict[str, Any] | None = None
     ) -> Any:
-        """Async API request. Returns the JSON body."""
-        url = f"{self.base_url.rstrip('/')}{path}"
-        resp = await self.async_client.request(method, url, params=self._clean(params or {}))
-        resp.raise_for_status()
-        return resp.json()
+        """Async API request. Returns the JSON body.
+
+        Concurrent identical GETs share a single round trip.
+        """
+        query = self._clean(params or {})
+        key = self._cache_key(method, path, query)
+        if key is None:
+            return _json.loads(await self._afetch(method, path, query))
+        cached = self._cache.get(key)  # type: ignore[union-attr]
+        if cached is MISSING:
+            cached = await self._single_flight(
+                key, lambda: self._afetch_cached(key, method, path, query)
+            )
+        return _json.loads(cached)
+
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fetch()`` once for every concurrent caller with the same ``key``.
+
+        All waiters get the shared task's result or its exception, so a failure
+        isn't retried once per waiter. Flights are per event loop.
+        """
+        flight = (asyncio.get_running_loop(), key)
+        task = self._inflight.get(flight)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[flight] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight, None))
+            task.add_done_callback(_retrieve_exception)
+        # Shielded so one cancelled caller doesn't cancel the others waiting on it.
+        return await asyncio.shield(task)
+
+    async def _afetch_cached(
+        self, key: Hashable, method: str, path: str, query: list[tuple[str, Any]]
+    ) -> bytes:
+        content = await self._afetch(method, path, query)
+        self._cache.set(key, content)  # type: ignore[union-attr]
+        return content
+
+    async def _afetch(self, method: str, path: str, query: list[tuple[str, Any]]) -> bytes:
+        """Async version of :meth:`_fetch`."""
+        resp = await self.async_client.request(method, path, params=query)
+        if not 200 <= resp.status_code < 300:
+            resp.raise_for_status()
+        return resp.content
+
+    def request_with_etag(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+    ) -> tuple[str | None, Any]:
+        """Conditional request that revalidates a previous response by its ETag.
+
+        Returns ``(etag, body)``; ``body`` is ``None`` when the server answers
+        304 Not Modified. The response cache is bypassed.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        resp = self.sync_client.request(
+            method, path, params=self._clean(params or {}), headers=headers
+        )
+        return self._etag_result(resp, etag)
+
+    async def arequest_with_etag(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+    ) -> tuple[str | None, Any]:
+        """Async version of :meth:`request_with_etag`."""
+        headers = {"If-None-Match": etag} if etag else None
+        resp = await self.async_client.request(
+            method, path, params=self._clean(params or {}), headers=headers
+        )
+        return self._etag_result(resp, etag)
+
+    @staticmethod
+    def _etag_result(resp: httpx.Response, etag: str | None) -> tuple[str | None, Any]:
+        if resp.status_code == 304:
+            return etag, None
+        if not 200 <= resp.status_code < 300:
+            resp.raise_for_status()
+        return resp.headers.get("ETag"), _json.loads(resp.content)
+
+    def stream_items(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        prefix: str = "data.item",
+    ) -> Iterator[Any]:
+        """Yield the JSON values at ``prefix`` (ijson syntax) as the body arrives.
+
+        With ``ijson`` installed the body is parsed incrementally, so items are
+        available before the whole response has been received and the raw bytes
+        are never held in full. Without it the body is buffered and parsed once.
+        """
+        with self.sync_client.stream(method, path, params=self._clean(params or {})) as resp:
+            if resp.is_error:
+                resp.read()
+                resp.raise_for_status()
+            if ijson is None:
+                resp.read()
+                yield from _items_at(_json.loads(resp.content), prefix)
+                return
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix, use_float=True)
+            for chunk in resp.iter_bytes():
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            parser.close()
+            yield from items
+
+    async def astream_items(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        prefix: str = "data.item",
+    ) -> AsyncIterator[Any]:
+        """Async version of :meth:`stream_items`."""
+        async with self.async_client.stream(
+            method, path, params=self._clean(params or {})
+        ) as resp:
+            if resp.is_error:
+                await resp.aread()
+                resp.raise_for_status()
+            if ijson is None:
+                await resp.aread()
+                for item in _items_at(_json.loads(resp.content), prefix):
+                    yield item
+                return
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix, use_float=True)
+            async for chunk in resp.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
+
+    async def amap_request(self, calls: Sequence[_Call], concurrency: int = 10) -> list[Any]:
+        """Run several API calls concurrently, at most ``concurrency`` at a time.
+
+        Returns the JSON bodies in the order of ``calls``; the first failure is raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(method: str, path: str, params: dict[str, Any] | None) -> Any:
+            async with semaphore:
+                return await self.arequest(method, path, params)
+
+        return list(await asyncio.gather(*(_one(*call) for call in calls)))
+
+
+def _credential_key(api_key: SecretStr, base_url: str) -> tuple[str, str]:
+    """Hashable stand-in for a (key, base URL) pair that never holds the raw key."""
+    return hashlib.sha256(api_key.get_secret_value().encode()).hexdigest(), base_url
+
+
+_SHARED_WRAPPERS: weakref.WeakValueDictionary[tuple[str, str], AxioraAPIWrapper] = (
+    weakref.WeakValueDictionary()
+)
+_SHARED_LOCK = threading.Lock()
+
+
+def _shared_wrapper(
+    api_key: SecretStr | str, base_url: str = DEFAULT_BASE_URL
+) -> AxioraAPIWrapper:
+    """Return the process-wide wrapper for these credentials, creating it if needed.
+
+    Wrappers are held weakly, so the shared connection pool lives exactly as long
+    as something (a toolkit, tool or retriever) still references it.
+    """
+    secret = api_key if isinstance(api_key, SecretStr) else SecretStr(api_key)
+    key = _credential_key(secret, base_url)
+    with _SHARED_LOCK:
+        wrapper = _SHARED_WRAPPERS.get(key)
+        if wrapper is None:
+            wrapper = AxioraAPIWrapper(api_key=secret, base_url=base_url)
+            _SHARED_WRAPPERS[key] = wrapper
+        return wrapper
@@ -8,10 +8,13 @@ import httpx
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
-from langchain_core.utils import secret_from_env
-from pydantic import Field, SecretStr
+from pydantic import Field, SecretStr, model_validator
 
-from langchain_axiora.api_wrapper import AxioraAPIWrapper
+from langchain_axiora._env import _AXIORA_KEY_FACTORY, DEFAULT_BASE_URL
+from langchain_axiora.api_wrapper import AxioraAPIWrapper, _shared_wrapper
+
+# Item keys that become page_content rather than metadata.
+_CONTENT_KEYS = frozenset(("content", "snippet"))
 
 
 class AxioraRetriever(BaseRetriever):
@@ -33,6 +36,10 @@ class AxioraRetriever(BaseRetriever):
             governance, financial_notes, accounting_policy.
         k: int
             Max results to return (default 10, max 50).
+        api_wrapper: AxioraAPIWrapper | None
+            Existing wrapper to send requests through, e.g. a toolkit's, so the
+            retriever and the tools share one connection pool. Its key and base
+            URL are used when ``api_key``/``base_url`` aren't given.
 
     Instantiate:
         .. code-block:: python
@@ -41,6 +48,9 @@ class AxioraRetriever(BaseRetriever):
 
             retriever = AxioraRetriever()
 
+            # Or share a toolkit's connection pool
+            retriever = AxioraRetriever(api_wrapper=toolkit.api_wrapper)
+
     Invoke:
         .. code-block:: python
 
@@ -69,29 +79,35 @@ class AxioraRetriever(BaseRetriever):
 
     api_key: SecretStr = Field(
         alias="api_key",
-        default_factory=secret_from_env(
-            "AXIORA_API_KEY",
-            error_message=(
-                "Axiora API key not found. Set the AXIORA_API_KEY environment variable "
-                "or pass api_key= to the constructor."
-            ),
-        ),
+        default_factory=_AXIORA_KEY_FACTORY,
     )
-    base_url: str = Field(default="https://api.axiora.dev/v1")
+    base_url: str = Field(default=DEFAULT_BASE_URL)
     section: str | None = Field(
         default=None,
         description="Section filter: mda, risk_factors, business_overview, etc.",
     )
     k: int = Field(default=10, description="Max results (max 50)")
+    api_wrapper: AxioraAPIWrapper | None = Field(default=None, exclude=True)
 
     _api: AxioraAPIWrapper | None = None
 
     model_config = {"populate_by_name": True}
 
+    @model_validator(mode="before")
+    @classmethod
+    def _defaults_from_wrapper(cls, values: Any) -> Any:
+        if isinstance(values, dict) and values.get("api_wrapper") is not None:
+            wrapper: AxioraAPIWrapper = values["api_wrapper"]
+            values.setdefault("api_key", wrapper.api_key)
+            values.setdefault("base_url", wrapper.base_url)
+        return values
+
     @property
     def _wrapper(self) -> AxioraAPIWrapper:
+        if self.api_wrapper is not None:
+            return self.api_wrapper
         if self._api is None:
-            self._api = AxioraAPIWrapper(api_key=self.api_key, base_url=self.base_url)
+            self._api = _shared_wrapper(self.api_key, self.base_url)
         return self._api
 
     def _get_relevant_documents(
@@ -104,10 +120,12 @@ class AxioraRetriever(BaseRetriever):
         if self.section:
             params["section"] = self.section
         try:
-            result = self._wrapper.request("GET", "/translations/search", params)
+            return [
+                self._item_to_doc(item)
+                for item in self._wrapper.stream_items("GET", "/translations/search", params)
+            ]
         except httpx.HTTPStatusError:
             return []
-        return self._to_documents(result)
 
     async def _aget_relevant_documents(
         self,
@@ -118,22 +136,20 @@ class AxioraRetriever(BaseRetriever):
         params: dict[str, Any] = {"q": query, "limit": self.k}
         if self.section:
             params["section"] = self.section
+        docs: list[Document] = []
         try:
-            result = await self._wrapper.arequest("GET", "/translations/search", params)
+            async for item in self._wrapper.astream_items(
+                "GET", "/translations/search", params
+            ):
+                docs.append(self._item_to_doc(item))
         except httpx.HTTPStatusError:
             return []
-        return self._to_documents(result)
+        return docs
 
     @staticmethod
-    def _to_documents(result: Any) -> list[Document]:
-        docs: list[Document] = []
-        items = result.get("data", []) if isinstance(result, dict) else []
-        for item in items:
-            content = item.get("content", item.get("snippet", ""))
-            metadata = {
-                k: v
-                for k, v in item.items()
-                if k not in ("content", "snippet") and v is not None
-            }
-            docs.append(Document(page_content=content, metadata=metadata))
-        return docs
+    def _item_to_doc(item: dict[str, Any]) -> Document:
+        # Fields are already the right types; skip per-document validation.
+        return Document.model_construct(
+            page_content=item.get("content") or item.get("snippet") or "",
+            metadata={k: v for k, v in item.items() if k not in _CONTENT_KEYS and v is not None},
+        )
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+from typing import Any
+
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import BaseToolkit
-from langchain_core.utils import secret_from_env
-from pydantic import Field, SecretStr, model_validator
+from pydantic import Field, PrivateAttr, SecretStr, model_validator
 
-from langchain_axiora.api_wrapper import AxioraAPIWrapper
+from langchain_axiora._env import _AXIORA_KEY_FACTORY, DEFAULT_BASE_URL
+from langchain_axiora.api_wrapper import AxioraAPIWrapper, _shared_wrapper
+from langchain_axiora.retriever import AxioraRetriever
 from langchain_axiora.tools import ALL_TOOLS
 
-_VALID_TOOL_NAMES: frozenset[str] = frozenset(
-    tool_cls.model_fields["name"].default for tool_cls in ALL_TOOLS
-)
+
+@functools.cache
+def _tools_by_name() -> dict[str, type[BaseTool]]:
+    return {tool_cls.model_fields["name"].default: tool_cls for tool_cls in ALL_TOOLS}
+
+
+@functools.cache
+def _valid_tool_names() -> frozenset[str]:
+    return frozenset(_tools_by_name())
 
 
 class AxioraToolkit(BaseToolkit):
@@ -30,7 +42,12 @@ class AxioraToolkit(BaseToolkit):
         api_key: str
             Axiora API key. Reads from ``AXIORA_API_KEY`` env var if not provided.
         selected_tools: list[str] | None
-            Optional subset of tool names to include (default: all 18).
+            Optional subset of tool names to include (default: all 18). Tools
+            are returned in the order given.
+        warmup: bool
+            If ``True`` and ``get_tools()`` is called inside a running event loop,
+            connect to the API in the background so the first tool call finds a
+            warm connection (default ``False``).
 
     Instantiate:
         .. code-block:: python
@@ -62,15 +79,9 @@ class AxioraToolkit(BaseToolkit):
 
     api_key: SecretStr = Field(
         alias="api_key",
-        default_factory=secret_from_env(
-            "AXIORA_API_KEY",
-            error_message=(
-                "Axiora API key not found. Set the AXIORA_API_KEY environment variable "
-                "or pass api_key= to the constructor."
-            ),
-        ),
+        default_factory=_AXIORA_KEY_FACTORY,
     )
-    base_url: str = Field(default="https://api.axiora.dev/v1")
+    base_url: str = Field(default=DEFAULT_BASE_URL)
     selected_tools: list[str] | None = Field(
         default=None,
         description=(
@@ -78,25 +89,64 @@ class AxioraToolkit(BaseToolkit):
             "If None, all 18 tools are returned."
         ),
     )
+    warmup: bool = Field(
+        default=False,
+        description="Pre-connect to the API in the background from get_tools().",
+    )
+
+    _api: AxioraAPIWrapper | None = PrivateAttr(default=None)
+    _warmup_task: asyncio.Task[None] | None = PrivateAttr(default=None)
 
     model_config = {"populate_by_name": True}
 
     @model_validator(mode="after")
     def _validate_selected_tools(self) -> "AxioraToolkit":
         if self.selected_tools is not None:
-            invalid = set(self.selected_tools) - _VALID_TOOL_NAMES
+            valid = _valid_tool_names()
+            invalid = set(self.selected_tools) - valid
             if invalid:
                 raise ValueError(
                     f"Invalid tool names: {sorted(invalid)}. "
-                    f"Valid names: {sorted(_VALID_TOOL_NAMES)}"
+                    f"Valid names: {sorted(valid)}"
                 )
         return self
 
+    @property
+    def api_wrapper(self) -> AxioraAPIWrapper:
+        """The API wrapper (and connection pool) shared by every tool from this toolkit."""
+        if self._api is None:
+            self._api = _shared_wrapper(self.api_key, self.base_url)
+        return self._api
+
     def get_tools(self) -> list[BaseTool]:
         """Return Axiora tools configured with the shared API wrapper."""
-        api = AxioraAPIWrapper(api_key=self.api_key, base_url=self.base_url)
-        all_tools = [tool_cls(api=api) for tool_cls in ALL_TOOLS]
-        if self.selected_tools is not None:
-            selected = set(self.selected_tools)
-            return [t for t in all_tools if t.name in selected]
-        return all_tools
+        api = self.api_wrapper
+        if self.warmup and self._warmup_task is None:
+            # Without a running loop there's nothing to schedule on; the first call connects.
+            with contextlib.suppress(RuntimeError):
+                self._warmup_task = asyncio.get_running_loop().create_task(api.warmup())
+        if self.selected_tools is None:
+            return [tool_cls(api=api) for tool_cls in ALL_TOOLS]
+        # Only build the requested tools, in the order they were asked for.
+        by_name = _tools_by_name()
+        return [by_name[name](api=api) for name in dict.fromkeys(self.selected_tools)]
+
+
+def make_shared(
+    api_key: str | SecretStr | None = None, base_url: str = DEFAULT_BASE_URL
+) -> tuple[AxioraAPIWrapper, AxioraRetriever, AxioraToolkit]:
+    """Build a wrapper, retriever and toolkit that all share one connection pool.
+
+    ``api_key`` falls back to the ``AXIORA_API_KEY`` environment variable.
+
+    .. code-block:: python
+
+        api, retriever, toolkit = make_shared()
+        tools = toolkit.get_tools()
+    """
+    kwargs: dict[str, Any] = {"base_url": base_url}
+    if api_key is not None:
+        kwargs["api_key"] = api_key
+    toolkit = AxioraToolkit(**kwargs)
+    api = toolkit.api_wrapper
+    return api, AxioraRetriever(api_wrapper=api), toolkit
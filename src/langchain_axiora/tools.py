@@ -3,24 +3,78 @@
 from __future__ import annotations
 
 import json
-from typing import Any, NoReturn, Optional
+from abc import abstractmethod
+from collections.abc import Callable  # noqa: TC003  # pydantic evaluates annotations at runtime
+from typing import Any, Literal, NoReturn, Optional, cast
 
 import httpx
 from langchain_core.tools import BaseTool, ToolException
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, SecretStr, ValidationError, field_validator
+from pydantic.v1 import ValidationError as ValidationErrorV1  # noqa: TC002  # same reason
 
-from langchain_axiora.api_wrapper import AxioraAPIWrapper
+from langchain_axiora import _json
+from langchain_axiora._cache import MISSING
+from langchain_axiora._env import _AXIORA_KEY_FACTORY, DEFAULT_BASE_URL
+from langchain_axiora.api_wrapper import AxioraAPIWrapper, _shared_wrapper
 
 
 # ---------------------------------------------------------------------------
 # Input schemas
 # ---------------------------------------------------------------------------
 
+# Closed value sets are Literals so bad values are rejected before a round trip.
+_Order = Literal["desc", "asc"]
+_RankingMetric = Literal[
+    "revenue",
+    "net_income",
+    "operating_income",
+    "total_assets",
+    "roe",
+    "roa",
+    "operating_margin",
+    "net_margin",
+    "equity_ratio",
+    "eps",
+    "bps",
+]
+_TimeseriesMetric = Literal[
+    "revenue",
+    "net_income",
+    "operating_income",
+    "total_assets",
+    "total_equity",
+    "eps",
+    "bps",
+    "dividends_per_share",
+    "operating_cf",
+    "investing_cf",
+    "financing_cf",
+    "roe",
+    "pe_ratio",
+    "num_employees",
+]
+_Section = Literal[
+    "mda",
+    "risk_factors",
+    "business_overview",
+    "governance",
+    "financial_notes",
+    "accounting_policy",
+]
+_DocType = Literal["120", "130", "140"]
+
+
+def _unique_codes(value: Any) -> Any:
+    """Drop repeated codes first, so the length limits count distinct companies."""
+    if isinstance(value, list) and all(isinstance(code, str) for code in value):
+        return list(dict.fromkeys(value))
+    return value
+
 
 class SearchCompaniesInput(BaseModel):
     query: str = Field(description="Company name (JP or EN), securities code, or EDINET code")
     sector: Optional[str] = Field(default=None, description="Sector filter (e.g. '電気機器')")
-    limit: int = Field(default=10, description="Max results (max 50)")
+    limit: int = Field(default=10, ge=1, le=50, description="Max results (max 50)")
 
 
 class GetCompanyInput(BaseModel):
@@ -29,16 +83,16 @@ class GetCompanyInput(BaseModel):
 
 class GetFinancialsInput(BaseModel):
     code: str = Field(description="EDINET code or securities code")
-    years: int = Field(default=5, description="Number of fiscal years (max 20)")
+    years: int = Field(default=5, ge=1, le=20, description="Number of fiscal years (max 20)")
 
 
 class GetGrowthInput(BaseModel):
     code: str = Field(description="EDINET code or securities code")
-    years: int = Field(default=5, description="Number of years (max 20)")
+    years: int = Field(default=5, ge=1, le=20, description="Number of years (max 20)")
 
 
 class GetRankingInput(BaseModel):
-    metric: str = Field(
+    metric: _RankingMetric = Field(
         default="revenue",
         description=(
             "Metric to rank by: revenue, net_income, operating_income, "
@@ -47,8 +101,8 @@ class GetRankingInput(BaseModel):
         ),
     )
     sector: Optional[str] = Field(default=None, description="Optional sector filter")
-    order: str = Field(default="desc", description="'desc' for top, 'asc' for bottom")
-    limit: int = Field(default=20, description="Number of results (max 100)")
+    order: _Order = Field(default="desc", description="'desc' for top, 'asc' for bottom")
+    limit: int = Field(default=20, ge=1, le=100, description="Number of results (max 100)")
 
 
 class GetSectorOverviewInput(BaseModel):
@@ -59,8 +113,12 @@ class GetSectorOverviewInput(BaseModel):
 
 
 class CompareCompaniesInput(BaseModel):
-    codes: list[str] = Field(description="List of 2-5 EDINET or securities codes")
-    years: int = Field(default=3, description="Number of years (max 10)")
+    codes: list[str] = Field(
+        min_length=2, max_length=5, description="List of 2-5 EDINET or securities codes"
+    )
+    years: int = Field(default=3, ge=1, le=10, description="Number of years (max 10)")
+
+    _dedupe_codes = field_validator("codes", mode="before")(_unique_codes)
 
 
 class ScreenCompaniesInput(BaseModel):
@@ -69,7 +127,7 @@ class ScreenCompaniesInput(BaseModel):
     min_net_income: Optional[int] = Field(default=None, description="Minimum net income in JPY")
     min_roe: Optional[float] = Field(default=None, description="Minimum ROE % (e.g. 10.0)")
     max_pe_ratio: Optional[float] = Field(default=None, description="Maximum PE ratio")
-    limit: int = Field(default=20, description="Max results (max 100)")
+    limit: int = Field(default=20, ge=1, le=100, description="Max results (max 100)")
 
 
 class GetHealthScoreInput(BaseModel):
@@ -78,18 +136,20 @@ class GetHealthScoreInput(BaseModel):
 
 class GetHealthRankingInput(BaseModel):
     sector: Optional[str] = Field(default=None, description="Optional sector filter")
-    order: str = Field(default="desc", description="'desc' for healthiest, 'asc' for weakest")
-    limit: int = Field(default=20, description="Max results (max 100)")
+    order: _Order = Field(default="desc", description="'desc' for healthiest, 'asc' for weakest")
+    limit: int = Field(default=20, ge=1, le=100, description="Max results (max 100)")
 
 
 class GetPeersInput(BaseModel):
     code: str = Field(description="EDINET code or securities code")
-    limit: int = Field(default=10, description="Max results (max 50)")
+    limit: int = Field(default=10, ge=1, le=50, description="Max results (max 50)")
 
 
 class GetTimeseriesInput(BaseModel):
-    codes: list[str] = Field(description="List of 1-5 EDINET or securities codes")
-    metric: str = Field(
+    codes: list[str] = Field(
+        min_length=1, max_length=5, description="List of 1-5 EDINET or securities codes"
+    )
+    metric: _TimeseriesMetric = Field(
         default="revenue",
         description=(
             "Metric: revenue, net_income, operating_income, total_assets, "
@@ -97,21 +157,23 @@ class GetTimeseriesInput(BaseModel):
             "investing_cf, financing_cf, roe, pe_ratio, num_employees"
         ),
     )
-    years: int = Field(default=10, description="Number of years (max 20)")
+    years: int = Field(default=10, ge=1, le=20, description="Number of years (max 20)")
+
+    _dedupe_codes = field_validator("codes", mode="before")(_unique_codes)
 
 
 class ListFilingsInput(BaseModel):
     company_code: Optional[str] = Field(default=None, description="Filter by company code")
-    doc_type: Optional[str] = Field(
+    doc_type: Optional[_DocType] = Field(
         default=None,
         description="Document type: 120=annual, 130=semi-annual, 140=quarterly",
     )
-    limit: int = Field(default=20, description="Max results (max 100)")
+    limit: int = Field(default=20, ge=1, le=100, description="Max results (max 100)")
 
 
 class GetTranslationsInput(BaseModel):
     doc_id: str = Field(description="EDINET document ID (e.g. 'S100ABCD')")
-    section: Optional[str] = Field(
+    section: Optional[_Section] = Field(
         default=None,
         description=(
             "Section filter: mda, risk_factors, business_overview, "
@@ -122,17 +184,21 @@ class GetTranslationsInput(BaseModel):
 
 class SearchTranslationsInput(BaseModel):
     query: str = Field(description="Search terms (e.g. 'semiconductor', 'risk factors')")
-    section: Optional[str] = Field(default=None, description="Section filter")
-    limit: int = Field(default=10, description="Max results (max 50)")
+    section: Optional[_Section] = Field(default=None, description="Section filter")
+    limit: int = Field(default=10, ge=1, le=50, description="Max results (max 50)")
 
 
 class GetFilingCalendarInput(BaseModel):
-    month: str = Field(description="Month in YYYY-MM format (e.g. '2025-06')")
+    month: str = Field(
+        pattern=r"^\d{4}-\d{2}$", description="Month in YYYY-MM format (e.g. '2025-06')"
+    )
 
 
 class SearchCompaniesBatchInput(BaseModel):
     queries: list[str] = Field(
-        description="List of up to 10 company identifiers (codes or name fragments)"
+        min_length=1,
+        max_length=10,
+        description="List of up to 10 company identifiers (codes or name fragments)",
     )
 
 
@@ -140,9 +206,28 @@ class SearchCompaniesBatchInput(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
+
+# (path, query params) for one API call.
+_Endpoint = tuple[str, "dict[str, Any] | None"]
+
+
+def _nz(**params: Any) -> dict[str, Any]:
+    """Drop ``None`` params so equal calls produce one canonical query."""
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def _csv_codes(codes: list[str]) -> str:
+    """Join company codes in a canonical order, so any permutation is one cache entry."""
+    return ",".join(sorted(set(codes)))
+
+
 def _fmt(data: Any) -> str:
     """Format API response as a compact JSON string for the LLM."""
-    return json.dumps(data, ensure_ascii=False, default=str)
+    return _json.dumps(data)
+
+
+# Credentials -> (ETag, formatted body) of the last /coverage response.
+_COVERAGE_ETAGS: dict[tuple[str, str], tuple[str, str]] = {}
 
 
 _HTTP_ERROR_HINTS: dict[int, str] = {
@@ -153,21 +238,25 @@ _HTTP_ERROR_HINTS: dict[int, str] = {
 }
 
 
+_HINT_SUFFIXES: dict[int, str] = {code: f". {hint}" for code, hint in _HTTP_ERROR_HINTS.items()}
+
+
 def _handle_http_error(exc: httpx.HTTPStatusError) -> NoReturn:
     """Convert an HTTP error into a helpful ToolException message."""
     status = exc.response.status_code
-    hint = _HTTP_ERROR_HINTS.get(status, "")
     try:
-        body = exc.response.json()
+        body = _json.loads(exc.response.content)
         detail = body.get("detail", body.get("error", ""))
     except Exception:
         detail = exc.response.text[:200]
-    parts = [f"Axiora API error {status}"]
-    if detail:
-        parts.append(str(detail))
-    if hint:
-        parts.append(hint)
-    raise ToolException(". ".join(parts)) from exc
+    message = f"Axiora API error {status}. {detail}" if detail else f"Axiora API error {status}"
+    raise ToolException(message + _HINT_SUFFIXES.get(status, "")) from exc
+
+
+def _handle_validation_error(exc: ValidationError | ValidationErrorV1) -> str:
+    """Turn out-of-range or unknown arguments into a message the agent can act on."""
+    problems = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors())
+    return f"Invalid arguments. {problems}"
 
 
 # ---------------------------------------------------------------------------
@@ -178,29 +267,97 @@ def _handle_http_error(exc: httpx.HTTPStatusError) -> NoReturn:
 class _AxioraBaseTool(BaseTool):
     """Base class that lets tools accept ``api_key`` directly.
 
+    Subclasses only implement :meth:`_endpoint`; the base class runs the request
+    (sync or async), caches the formatted result and maps HTTP errors.
+
     Any of these work::
 
         tool = MyTool(api_key="ax_live_...")       # direct key
         tool = MyTool()                             # reads AXIORA_API_KEY env var
         tool = MyTool(api=existing_wrapper)         # shared wrapper
+
+    Without ``api=``, tools with the same key and base URL reuse one wrapper.
     """
 
     api: AxioraAPIWrapper = Field(default=None)  # type: ignore[assignment]
     handle_tool_error: bool = True
+    handle_validation_error: (
+        bool | str | Callable[[ValidationError | ValidationErrorV1], str] | None
+    ) = Field(default=_handle_validation_error, exclude=True)
 
-    @model_validator(mode="before")
-    @classmethod
-    def _build_api_wrapper(cls, values: Any) -> Any:
-        if isinstance(values, dict) and values.get("api") is None:
-            kwargs: dict[str, Any] = {}
-            api_key = values.pop("api_key", None)
-            base_url = values.pop("base_url", None)
-            if api_key is not None:
-                kwargs["api_key"] = api_key
-            if base_url is not None:
-                kwargs["base_url"] = base_url
-            values["api"] = AxioraAPIWrapper(**kwargs)
-        return values
+    api_key: SecretStr | None = Field(default=None, exclude=True, repr=False)
+    base_url: str | None = Field(default=None, exclude=True)
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        if self.api is None:
+            # Tools built with the same credentials share one wrapper and its pool.
+            api_key = _AXIORA_KEY_FACTORY() if self.api_key is None else self.api_key
+            self.api = _shared_wrapper(api_key, self.base_url or DEFAULT_BASE_URL)
+
+    @abstractmethod
+    def _endpoint(self, *args: Any, **kwargs: Any) -> _Endpoint:
+        """Map the tool's arguments to the API path and query params to GET."""
+
+    def _run(self, *args: Any, **kwargs: Any) -> str:
+        path, params = self._endpoint(*args, **kwargs)
+        try:
+            return self._cached_request("GET", path, params)
+        except httpx.HTTPStatusError as exc:
+            return _handle_http_error(exc)
+
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        path, params = self._endpoint(*args, **kwargs)
+        try:
+            return await self._acached_request("GET", path, params)
+        except httpx.HTTPStatusError as exc:
+            return _handle_http_error(exc)
+
+    def _result_key(
+        self, method: str, path: str, params: dict[str, Any] | None
+    ) -> tuple[Any, ...] | None:
+        # LLM agents repeat the same tool call a lot, so the formatted result is
+        # kept in the wrapper's response cache: same TTL, same clear_cache().
+        # It is the only entry stored; the raw-body cache is bypassed on a miss.
+        if self.api._cache is None or method.upper() != "GET":
+            return None
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        return ("result", path, query)
+
+    def _cached_request(self, method: str, path: str, params: dict[str, Any] | None = None) -> str:
+        """Call the API and return the formatted result, reusing a recent identical call."""
+        key = self._result_key(method, path, params)
+        if key is None:
+            return _fmt(self.api.request(method, path, params))
+        cached = self.api._cache.get(key)  # type: ignore[union-attr]
+        if cached is not MISSING:
+            return cast("str", cached)
+        result = _fmt(_json.loads(self.api._fetch(method, path, self.api._clean(params or {}))))
+        self.api._cache.set(key, result)  # type: ignore[union-attr]
+        return result
+
+    async def _acached_request(
+        self, method: str, path: str, params: dict[str, Any] | None = None
+    ) -> str:
+        """Async version of :meth:`_cached_request`; concurrent identical calls share one."""
+        key = self._result_key(method, path, params)
+        if key is None:
+            return _fmt(await self.api.arequest(method, path, params))
+        cached = self.api._cache.get(key)  # type: ignore[union-attr]
+        if cached is not MISSING:
+            return cast("str", cached)
+        result = await self.api._single_flight(
+            key, lambda: self._afetch_result(key, method, path, params)
+        )
+        return cast("str", result)
+
+    async def _afetch_result(
+        self, key: tuple[Any, ...], method: str, path: str, params: dict[str, Any] | None
+    ) -> str:
+        content = await self.api._afetch(method, path, self.api._clean(params or {}))
+        result = _fmt(_json.loads(content))
+        self.api._cache.set(key, result)  # type: ignore[union-attr]
+        return result
 
 
 # ---------------------------------------------------------------------------
@@ -217,21 +374,8 @@ class SearchCompaniesTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = SearchCompaniesInput
 
-    def _run(self, query: str, sector: str | None = None, limit: int = 10) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET", "/companies/search", {"q": query, "sector": sector, "limit": limit}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, query: str, sector: str | None = None, limit: int = 10) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET", "/companies/search", {"q": query, "sector": sector, "limit": limit}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, query: str, sector: str | None = None, limit: int = 10) -> _Endpoint:
+        return "/companies/search", _nz(q=query, sector=sector, limit=limit)
 
 
 class GetCompanyTool(_AxioraBaseTool):
@@ -243,17 +387,8 @@ class GetCompanyTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetCompanyInput
 
-    def _run(self, code: str) -> str:
-        try:
-            return _fmt(self.api.request("GET", f"/companies/{code}"))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, code: str) -> str:
-        try:
-            return _fmt(await self.api.arequest("GET", f"/companies/{code}"))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, code: str) -> _Endpoint:
+        return f"/companies/{code}", None
 
 
 class GetFinancialsTool(_AxioraBaseTool):
@@ -265,23 +400,8 @@ class GetFinancialsTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetFinancialsInput
 
-    def _run(self, code: str, years: int = 5) -> str:
-        try:
-            return _fmt(
-                self.api.request("GET", f"/companies/{code}/financials", {"years": years})
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, code: str, years: int = 5) -> str:
-        try:
-            return _fmt(
-                await self.api.arequest(
-                    "GET", f"/companies/{code}/financials", {"years": years}
-                )
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, code: str, years: int = 5) -> _Endpoint:
+        return f"/companies/{code}/financials", _nz(years=years)
 
 
 class GetGrowthTool(_AxioraBaseTool):
@@ -293,21 +413,8 @@ class GetGrowthTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetGrowthInput
 
-    def _run(self, code: str, years: int = 5) -> str:
-        try:
-            return _fmt(
-                self.api.request("GET", f"/companies/{code}/growth", {"years": years})
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, code: str, years: int = 5) -> str:
-        try:
-            return _fmt(
-                await self.api.arequest("GET", f"/companies/{code}/growth", {"years": years})
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, code: str, years: int = 5) -> _Endpoint:
+        return f"/companies/{code}/growth", _nz(years=years)
 
 
 class GetRankingTool(_AxioraBaseTool):
@@ -319,37 +426,14 @@ class GetRankingTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetRankingInput
 
-    def _run(
-        self,
-        metric: str = "revenue",
-        sector: str | None = None,
-        order: str = "desc",
-        limit: int = 20,
-    ) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET",
-                f"/rankings/{metric}",
-                {"sector": sector, "order": order, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(
+    def _endpoint(
         self,
         metric: str = "revenue",
         sector: str | None = None,
         order: str = "desc",
         limit: int = 20,
-    ) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET",
-                f"/rankings/{metric}",
-                {"sector": sector, "order": order, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    ) -> _Endpoint:
+        return f"/rankings/{metric}", _nz(sector=sector, order=order, limit=limit)
 
 
 class GetSectorOverviewTool(_AxioraBaseTool):
@@ -360,21 +444,10 @@ class GetSectorOverviewTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetSectorOverviewInput
 
-    def _run(self, sector: str | None = None) -> str:
-        try:
-            if sector:
-                return _fmt(self.api.request("GET", f"/sectors/{sector}"))
-            return _fmt(self.api.request("GET", "/sectors"))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, sector: str | None = None) -> str:
-        try:
-            if sector:
-                return _fmt(await self.api.arequest("GET", f"/sectors/{sector}"))
-            return _fmt(await self.api.arequest("GET", "/sectors"))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, sector: str | None = None) -> _Endpoint:
+        if sector:
+            return f"/sectors/{sector}", None
+        return "/sectors", None
 
 
 class CompareCompaniesTool(_AxioraBaseTool):
@@ -386,21 +459,8 @@ class CompareCompaniesTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = CompareCompaniesInput
 
-    def _run(self, codes: list[str], years: int = 3) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET", "/compare", {"codes": ",".join(codes), "years": years}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, codes: list[str], years: int = 3) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET", "/compare", {"codes": ",".join(codes), "years": years}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, codes: list[str], years: int = 3) -> _Endpoint:
+        return "/compare", _nz(codes=_csv_codes(codes), years=years)
 
 
 class ScreenCompaniesTool(_AxioraBaseTool):
@@ -412,7 +472,7 @@ class ScreenCompaniesTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = ScreenCompaniesInput
 
-    def _run(
+    def _endpoint(
         self,
         sector: str | None = None,
         min_revenue: int | None = None,
@@ -420,47 +480,15 @@ class ScreenCompaniesTool(_AxioraBaseTool):
         min_roe: float | None = None,
         max_pe_ratio: float | None = None,
         limit: int = 20,
-    ) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET",
-                "/screen",
-                {
-                    "sector": sector,
-                    "min_revenue": min_revenue,
-                    "min_net_income": min_net_income,
-                    "min_roe": min_roe,
-                    "max_pe_ratio": max_pe_ratio,
-                    "limit": limit,
-                },
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(
-        self,
-        sector: str | None = None,
-        min_revenue: int | None = None,
-        min_net_income: int | None = None,
-        min_roe: float | None = None,
-        max_pe_ratio: float | None = None,
-        limit: int = 20,
-    ) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET",
-                "/screen",
-                {
-                    "sector": sector,
-                    "min_revenue": min_revenue,
-                    "min_net_income": min_net_income,
-                    "min_roe": min_roe,
-                    "max_pe_ratio": max_pe_ratio,
-                    "limit": limit,
-                },
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    ) -> _Endpoint:
+        return "/screen", _nz(
+            sector=sector,
+            min_revenue=min_revenue,
+            min_net_income=min_net_income,
+            min_roe=min_roe,
+            max_pe_ratio=max_pe_ratio,
+            limit=limit,
+        )
 
 
 class GetHealthScoreTool(_AxioraBaseTool):
@@ -472,17 +500,8 @@ class GetHealthScoreTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetHealthScoreInput
 
-    def _run(self, code: str) -> str:
-        try:
-            return _fmt(self.api.request("GET", f"/companies/{code}/health"))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, code: str) -> str:
-        try:
-            return _fmt(await self.api.arequest("GET", f"/companies/{code}/health"))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, code: str) -> _Endpoint:
+        return f"/companies/{code}/health", None
 
 
 class GetHealthRankingTool(_AxioraBaseTool):
@@ -493,29 +512,10 @@ class GetHealthRankingTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetHealthRankingInput
 
-    def _run(
+    def _endpoint(
         self, sector: str | None = None, order: str = "desc", limit: int = 20
-    ) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET",
-                "/rankings/health",
-                {"sector": sector, "order": order, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(
-        self, sector: str | None = None, order: str = "desc", limit: int = 20
-    ) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET",
-                "/rankings/health",
-                {"sector": sector, "order": order, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    ) -> _Endpoint:
+        return "/rankings/health", _nz(sector=sector, order=order, limit=limit)
 
 
 class GetPeersTool(_AxioraBaseTool):
@@ -527,21 +527,8 @@ class GetPeersTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetPeersInput
 
-    def _run(self, code: str, limit: int = 10) -> str:
-        try:
-            return _fmt(
-                self.api.request("GET", f"/companies/{code}/peers", {"limit": limit})
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, code: str, limit: int = 10) -> str:
-        try:
-            return _fmt(
-                await self.api.arequest("GET", f"/companies/{code}/peers", {"limit": limit})
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, code: str, limit: int = 10) -> _Endpoint:
+        return f"/companies/{code}/peers", _nz(limit=limit)
 
 
 class GetTimeseriesTool(_AxioraBaseTool):
@@ -553,29 +540,8 @@ class GetTimeseriesTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetTimeseriesInput
 
-    def _run(
-        self, codes: list[str], metric: str = "revenue", years: int = 10
-    ) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET",
-                "/timeseries",
-                {"codes": ",".join(codes), "metric": metric, "years": years},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(
-        self, codes: list[str], metric: str = "revenue", years: int = 10
-    ) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET",
-                "/timeseries",
-                {"codes": ",".join(codes), "metric": metric, "years": years},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, codes: list[str], metric: str = "revenue", years: int = 10) -> _Endpoint:
+        return "/timeseries", _nz(codes=_csv_codes(codes), metric=metric, years=years)
 
 
 class ListFilingsTool(_AxioraBaseTool):
@@ -586,35 +552,13 @@ class ListFilingsTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = ListFilingsInput
 
-    def _run(
+    def _endpoint(
         self,
         company_code: str | None = None,
         doc_type: str | None = None,
         limit: int = 20,
-    ) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET",
-                "/filings",
-                {"company_code": company_code, "doc_type": doc_type, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(
-        self,
-        company_code: str | None = None,
-        doc_type: str | None = None,
-        limit: int = 20,
-    ) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET",
-                "/filings",
-                {"company_code": company_code, "doc_type": doc_type, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    ) -> _Endpoint:
+        return "/filings", _nz(company_code=company_code, doc_type=doc_type, limit=limit)
 
 
 class GetTranslationsTool(_AxioraBaseTool):
@@ -626,21 +570,8 @@ class GetTranslationsTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetTranslationsInput
 
-    def _run(self, doc_id: str, section: str | None = None) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET", f"/translations/{doc_id}", {"section": section}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, doc_id: str, section: str | None = None) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET", f"/translations/{doc_id}", {"section": section}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, doc_id: str, section: str | None = None) -> _Endpoint:
+        return f"/translations/{doc_id}", _nz(section=section)
 
 
 class SearchTranslationsTool(_AxioraBaseTool):
@@ -652,25 +583,8 @@ class SearchTranslationsTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = SearchTranslationsInput
 
-    def _run(self, query: str, section: str | None = None, limit: int = 10) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET",
-                "/translations/search",
-                {"q": query, "section": section, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, query: str, section: str | None = None, limit: int = 10) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET",
-                "/translations/search",
-                {"q": query, "section": section, "limit": limit},
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, query: str, section: str | None = None, limit: int = 10) -> _Endpoint:
+        return "/translations/search", _nz(q=query, section=section, limit=limit)
 
 
 class GetFilingCalendarTool(_AxioraBaseTool):
@@ -681,19 +595,8 @@ class GetFilingCalendarTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = GetFilingCalendarInput
 
-    def _run(self, month: str) -> str:
-        try:
-            return _fmt(self.api.request("GET", "/filings/calendar", {"month": month}))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, month: str) -> str:
-        try:
-            return _fmt(
-                await self.api.arequest("GET", "/filings/calendar", {"month": month})
-            )
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, month: str) -> _Endpoint:
+        return "/filings/calendar", _nz(month=month)
 
 
 class SearchCompaniesBatchTool(_AxioraBaseTool):
@@ -705,21 +608,8 @@ class SearchCompaniesBatchTool(_AxioraBaseTool):
     )
     args_schema: type[BaseModel] = SearchCompaniesBatchInput
 
-    def _run(self, queries: list[str]) -> str:
-        try:
-            return _fmt(self.api.request(
-                "GET", "/companies/search", {"queries": ",".join(queries)}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
-
-    async def _arun(self, queries: list[str]) -> str:
-        try:
-            return _fmt(await self.api.arequest(
-                "GET", "/companies/search", {"queries": ",".join(queries)}
-            ))
-        except httpx.HTTPStatusError as exc:
-            return _handle_http_error(exc)
+    def _endpoint(self, queries: list[str]) -> _Endpoint:
+        return "/companies/search", _nz(queries=",".join(dict.fromkeys(queries)))
 
 
 class GetCoverageTool(_AxioraBaseTool):
@@ -729,17 +619,68 @@ class GetCoverageTool(_AxioraBaseTool):
         "and data freshness. Use this to understand what data is available before querying."
     )
 
+    def _endpoint(self) -> _Endpoint:
+        return "/coverage", None
+
+    # No args_schema: LangChain infers the (empty) schema from these signatures.
+    # Coverage changes rarely, so once the result cache expires it is revalidated
+    # with If-None-Match; a 304 reuses the formatted body without a reparse.
     def _run(self) -> str:
-        try:
-            return _fmt(self.api.request("GET", "/coverage"))
+        key = self._result_key("GET", "/coverage", None)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+        seen = _COVERAGE_ETAGS.get(self.api._identity)
+        try:
+            etag, data = self.api.request_with_etag(
+                "GET", "/coverage", etag=seen[0] if seen else None
+            )
         except httpx.HTTPStatusError as exc:
             return _handle_http_error(exc)
+        return self._remember(key, seen, etag, data)
 
     async def _arun(self) -> str:
+        key = self._result_key("GET", "/coverage", None)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
         try:
-            return _fmt(await self.api.arequest("GET", "/coverage"))
+            if key is None:
+                return await self._arevalidate(key)
+            result = await self.api._single_flight(key, lambda: self._arevalidate(key))
         except httpx.HTTPStatusError as exc:
             return _handle_http_error(exc)
+        return cast("str", result)
+
+    async def _arevalidate(self, key: tuple[Any, ...] | None) -> str:
+        seen = _COVERAGE_ETAGS.get(self.api._identity)
+        etag, data = await self.api.arequest_with_etag(
+            "GET", "/coverage", etag=seen[0] if seen else None
+        )
+        return self._remember(key, seen, etag, data)
+
+    def _cached_result(self, key: tuple[Any, ...] | None) -> str | None:
+        if key is None:
+            return None
+        cached = self.api._cache.get(key)  # type: ignore[union-attr]
+        return None if cached is MISSING else cast("str", cached)
+
+    def _remember(
+        self,
+        key: tuple[Any, ...] | None,
+        seen: tuple[str, str] | None,
+        etag: str | None,
+        data: Any,
+    ) -> str:
+        if data is None and seen is not None:
+            result = seen[1]
+        else:
+            result = _fmt(data)
+            if etag:
+                _COVERAGE_ETAGS[self.api._identity] = (etag, result)
+        if key is not None:
+            self.api._cache.set(key, result)  # type: ignore[union-attr]
+        return result
 
 
 ALL_TOOLS: list[type[BaseTool]] = [
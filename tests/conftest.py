@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from langchain_axiora import AxioraToolkit, api_wrapper, tools
 from langchain_axiora.api_wrapper import AxioraAPIWrapper
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langchain_core.tools import BaseTool
+
+
+def _clear_shared_caches() -> None:
+    for wrapper in list(api_wrapper._SHARED_WRAPPERS.values()):
+        wrapper.clear_cache()
+    tools._COVERAGE_ETAGS.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    """Keep cached responses on shared wrappers from leaking between tests."""
+    _clear_shared_caches()
+    yield
+    _clear_shared_caches()
+
 
 @pytest.fixture
 def api():
@@ -16,6 +40,18 @@ def api():
     return AxioraAPIWrapper(api_key="ax_test_key")
 
 
+@pytest.fixture(scope="session")
+def toolkit_full() -> AxioraToolkit:
+    """Toolkit with every tool, built once for tests that only read metadata."""
+    return AxioraToolkit(api_key="ax_test_key")
+
+
+@pytest.fixture(scope="session")
+def toolkit_tools(toolkit_full: AxioraToolkit) -> list[BaseTool]:
+    """The toolkit's tools; treat as read-only, they are shared by the session."""
+    return toolkit_full.get_tools()
+
+
 @pytest.fixture
 def mock_api(api: AxioraAPIWrapper):
     """Yield (api, mock_client) with a mock HTTP client attached."""
@@ -23,6 +59,7 @@ def mock_api(api: AxioraAPIWrapper):
     mock_resp.status_code = 200
     mock_resp.raise_for_status = MagicMock()
     mock_resp.json.return_value = {"data": [], "meta": {}}
+    mock_resp.content = b'{"data": [], "meta": {}}'
 
     mock_client = MagicMock()
     mock_client.request.return_value = mock_resp
@@ -31,3 +68,31 @@ def mock_api(api: AxioraAPIWrapper):
         type(api), "sync_client", new_callable=PropertyMock, return_value=mock_client
     ):
         yield api, mock_client, mock_resp
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Answer every GET with ``{"data": [{"content": <path>}]}`` over a kept-alive connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = json.dumps({"data": [{"content": self.path}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def keepalive_url() -> Iterator[str]:
+    """Base URL of a local server whose connections outlive a single request."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
@@ -1,6 +1,6 @@
 """Integration tests that hit the live Axiora API.
 
-Run with: pytest tests/integration_tests/ -v
+Not collected by default; run with: pytest tests/integration_tests/ -m live -v
 
 Requires AXIORA_API_KEY environment variable to be set.
 These tests are skipped in CI unless the env var is present.
@@ -8,57 +8,72 @@ These tests are skipped in CI unless the env var is present.
 
 from __future__ import annotations
 
+import asyncio
 import os
+from typing import Any
 
 import pytest
-
-pytestmark = pytest.mark.skipif(
-    not os.environ.get("AXIORA_API_KEY"),
-    reason="AXIORA_API_KEY not set — skipping live API tests",
+import pytest_asyncio
+
+from langchain_axiora import (
+    AxioraAPIWrapper,
+    AxioraRetriever,
+    AxioraToolkit,
+    GetFinancialsTool,
+    GetHealthScoreTool,
+    SearchCompaniesTool,
 )
 
+pytestmark = [
+    pytest.mark.live,
+    pytest.mark.skipif(
+        not os.environ.get("AXIORA_API_KEY"),
+        reason="AXIORA_API_KEY not set — skipping live API tests",
+    ),
+]
 
-@pytest.fixture
-def api_key():
-    return os.environ["AXIORA_API_KEY"]
 
+@pytest.fixture(scope="module")
+def api_key() -> str:
+    return os.environ["AXIORA_API_KEY"]
 
-def test_search_companies_live(api_key: str):
-    from langchain_axiora import SearchCompaniesTool
 
-    tool = SearchCompaniesTool(api_key=api_key)
-    result = tool.invoke({"query": "Toyota"})
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def live_results(api_key: str) -> dict[str, Any]:
+    """Make every live call once, concurrently, over one shared connection pool."""
+    async with AxioraAPIWrapper(api_key=api_key) as api:
+        search, financials, health, docs = await asyncio.gather(
+            SearchCompaniesTool(api=api).ainvoke({"query": "Toyota"}),
+            GetFinancialsTool(api=api).ainvoke({"code": "7203", "years": 1}),
+            GetHealthScoreTool(api=api).ainvoke({"code": "7203"}),
+            AxioraRetriever(api_wrapper=api, k=3).ainvoke("semiconductor"),
+        )
+    return {
+        "search": search,
+        "financials": financials,
+        "health": health,
+        "docs": docs,
+        "tools": AxioraToolkit(api_key=api_key).get_tools(),
+    }
+
+
+def test_search_companies_live(live_results: dict[str, Any]):
+    result = live_results["search"]
     assert "Toyota" in result or "トヨタ" in result
 
 
-def test_get_financials_live(api_key: str):
-    from langchain_axiora import GetFinancialsTool
-
-    tool = GetFinancialsTool(api_key=api_key)
-    result = tool.invoke({"code": "7203", "years": 1})
-    assert "revenue" in result
-
-
-def test_get_health_score_live(api_key: str):
-    from langchain_axiora import GetHealthScoreTool
-
-    tool = GetHealthScoreTool(api_key=api_key)
-    result = tool.invoke({"code": "7203"})
-    assert "score" in result
+def test_get_financials_live(live_results: dict[str, Any]):
+    assert "revenue" in live_results["financials"]
 
 
-def test_toolkit_live(api_key: str):
-    from langchain_axiora import AxioraToolkit
+def test_get_health_score_live(live_results: dict[str, Any]):
+    assert "score" in live_results["health"]
 
-    toolkit = AxioraToolkit(api_key=api_key)
-    tools = toolkit.get_tools()
-    assert len(tools) == 18
 
+def test_toolkit_live(live_results: dict[str, Any]):
+    assert len(live_results["tools"]) == 18
 
-def test_retriever_live(api_key: str):
-    from langchain_axiora import AxioraRetriever
 
-    retriever = AxioraRetriever(api_key=api_key, k=3)
-    docs = retriever.invoke("semiconductor")
+def test_retriever_live(live_results: dict[str, Any]):
     # May return 0 docs if no translations match, but shouldn't crash
-    assert isinstance(docs, list)
+    assert isinstance(live_results["docs"], list)
@@ -2,7 +2,7 @@
 
 from langchain_axiora import __all__
 
-EXPECTED_ALL = [
+EXPECTED_ALL = frozenset({
     "ALL_TOOLS",
     "AxioraAPIWrapper",
     "AxioraRetriever",
@@ -25,16 +25,35 @@ EXPECTED_ALL = [
     "SearchCompaniesBatchTool",
     "SearchCompaniesTool",
     "SearchTranslationsTool",
-]
+    "make_shared",
+})
 
 
 def test_all_exports_match():
-    assert sorted(__all__) == sorted(EXPECTED_ALL)
+    assert frozenset(__all__) == EXPECTED_ALL
+    assert len(__all__) == len(EXPECTED_ALL), "duplicate names in __all__"
 
 
 def test_all_importable():
     """Every name in __all__ is actually importable."""
     import langchain_axiora
 
-    for name in __all__:
-        assert hasattr(langchain_axiora, name), f"{name} listed in __all__ but not importable"
+    # getattr (not dir()) so each lazy export is really resolved.
+    missing = [name for name in __all__ if not hasattr(langchain_axiora, name)]
+    assert not missing, f"listed in __all__ but not importable: {missing}"
+
+
+def test_tools_are_imported_lazily():
+    """Importing the package alone doesn't load the tool, toolkit or retriever modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, langchain_axiora; "
+        "print(sorted(m for m in sys.modules if m.startswith('langchain_axiora.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    for module in ("tools", "toolkit", "retriever"):
+        assert f"langchain_axiora.{module}'" not in out
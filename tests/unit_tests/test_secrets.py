@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import json
-
+import pytest
 from pydantic import SecretStr
 
 from langchain_axiora import AxioraToolkit
@@ -14,41 +13,63 @@ from langchain_axiora.tools import GetFinancialsTool, SearchCompaniesTool
 SECRET = "ax_live_supersecretkey123"
 
 
-def test_api_wrapper_uses_secret_str():
-    api = AxioraAPIWrapper(api_key=SECRET)
-    assert isinstance(api.api_key, SecretStr)
+# These tests only read repr/str/dumps, so each object is built once per module.
+@pytest.fixture(scope="module")
+def secret_api() -> AxioraAPIWrapper:
+    return AxioraAPIWrapper(api_key=SECRET)
 
 
-def test_api_wrapper_hides_key_in_repr():
-    api = AxioraAPIWrapper(api_key=SECRET)
-    assert SECRET not in repr(api)
-    assert SECRET not in str(api)
+@pytest.fixture(scope="module")
+def secret_tool_fin() -> GetFinancialsTool:
+    return GetFinancialsTool(api_key=SECRET)
 
 
-def test_api_wrapper_hides_key_in_json():
-    api = AxioraAPIWrapper(api_key=SECRET)
-    dumped = api.model_dump_json()
+@pytest.fixture(scope="module")
+def secret_tool_search() -> SearchCompaniesTool:
+    return SearchCompaniesTool(api_key=SECRET)
+
+
+@pytest.fixture(scope="module")
+def secret_toolkit() -> AxioraToolkit:
+    return AxioraToolkit(api_key=SECRET)
+
+
+def test_api_wrapper_uses_secret_str(secret_api: AxioraAPIWrapper):
+    assert isinstance(secret_api.api_key, SecretStr)
+
+
+def test_api_wrapper_hides_key_in_repr(secret_api: AxioraAPIWrapper):
+    assert SECRET not in repr(secret_api)
+    assert SECRET not in str(secret_api)
+
+
+def test_api_wrapper_hides_key_in_json(secret_api: AxioraAPIWrapper):
+    dumped = secret_api.model_dump_json()
     assert SECRET not in dumped
 
 
-def test_api_wrapper_get_secret_value():
+def test_api_wrapper_hides_key_after_headers_cached():
+    # Own instance: caching the headers must not depend on test order.
     api = AxioraAPIWrapper(api_key=SECRET)
-    assert api.api_key.get_secret_value() == SECRET
+    assert api._headers["Authorization"] == f"Bearer {SECRET}"
+    assert SECRET not in repr(api)
+    assert SECRET not in api.model_dump_json()
+
+
+def test_api_wrapper_get_secret_value(secret_api: AxioraAPIWrapper):
+    assert secret_api.api_key.get_secret_value() == SECRET
 
 
-def test_tool_hides_key_in_repr():
-    tool = GetFinancialsTool(api_key=SECRET)
-    assert SECRET not in repr(tool)
-    assert SECRET not in str(tool)
+def test_tool_hides_key_in_repr(secret_tool_fin: GetFinancialsTool):
+    assert SECRET not in repr(secret_tool_fin)
+    assert SECRET not in str(secret_tool_fin)
 
 
-def test_tool_hides_key_in_json():
-    tool = SearchCompaniesTool(api_key=SECRET)
-    dumped = json.dumps(tool.model_dump(), default=str)
+def test_tool_hides_key_in_json(secret_tool_search: SearchCompaniesTool):
+    dumped = secret_tool_search.model_dump_json(exclude={"args_schema"})
     assert SECRET not in dumped
 
 
-def test_toolkit_hides_key_in_repr():
-    toolkit = AxioraToolkit(api_key=SECRET)
-    assert SECRET not in repr(toolkit)
-    assert SECRET not in str(toolkit)
+def test_toolkit_hides_key_in_repr(secret_toolkit: AxioraToolkit):
+    assert SECRET not in repr(secret_toolkit)
+    assert SECRET not in str(secret_toolkit)
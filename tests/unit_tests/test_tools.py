@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import MagicMock, PropertyMock, patch
+import asyncio
+import datetime
+import gc
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import PropertyMock, patch
 
 import httpx
 import pytest
-from langchain_core.tools import ToolException
-
-from langchain_axiora import AxioraToolkit
-from langchain_axiora.api_wrapper import AxioraAPIWrapper
+from langchain_core.tools import BaseTool, ToolException
+from pydantic import ValidationError
+
+from langchain_axiora import (
+    AxioraRetriever,
+    AxioraToolkit,
+    _json,
+    api_wrapper,
+    make_shared,
+    tools,
+)
+from langchain_axiora.api_wrapper import DEFAULT_BASE_URL, AxioraAPIWrapper
 from langchain_axiora.tools import (
     ALL_TOOLS,
     GetCompanyTool,
+    GetCoverageTool,
     GetFinancialsTool,
+    GetRankingInput,
+    GetRankingTool,
+    ListFilingsInput,
     SearchCompaniesTool,
+    _handle_http_error,
 )
 
+_TOOLS_WITHOUT_SCHEMA = frozenset({GetCoverageTool})
+
 
 @pytest.fixture
 def api():
@@ -29,11 +50,9 @@ def api():
 # ---------------------------------------------------------------------------
 
 
-def test_toolkit_returns_all_tools():
-    toolkit = AxioraToolkit(api_key="ax_test_key")
-    tools = toolkit.get_tools()
-    assert len(tools) == 18
-    names = {t.name for t in tools}
+def test_toolkit_returns_all_tools(toolkit_tools: list[BaseTool]):
+    assert len(toolkit_tools) == 18
+    names = {t.name for t in toolkit_tools}
     assert "axiora_search_companies" in names
     assert "axiora_get_financials" in names
     assert "axiora_get_health_score" in names
@@ -50,6 +69,17 @@ def test_toolkit_selected_tools():
     assert names == {"axiora_search_companies", "axiora_get_financials"}
 
 
+def test_toolkit_selected_tools_keep_requested_order():
+    toolkit = AxioraToolkit(
+        api_key="ax_test_key",
+        selected_tools=["axiora_get_coverage", "axiora_search_companies", "axiora_get_coverage"],
+    )
+    assert [t.name for t in toolkit.get_tools()] == [
+        "axiora_get_coverage",
+        "axiora_search_companies",
+    ]
+
+
 def test_toolkit_invalid_selected_tools():
     with pytest.raises(ValueError, match="Invalid tool names"):
         AxioraToolkit(
@@ -58,11 +88,42 @@ def test_toolkit_invalid_selected_tools():
         )
 
 
-def test_toolkit_reads_env_var():
-    with patch.dict(os.environ, {"AXIORA_API_KEY": "ax_from_env"}):
-        toolkit = AxioraToolkit()
-        tools = toolkit.get_tools()
-        assert len(tools) == 18
+def test_toolkit_reuses_api_wrapper():
+    toolkit = AxioraToolkit(api_key="ax_test_key")
+    first, second = toolkit.get_tools(), toolkit.get_tools()
+    assert first[0].api is second[0].api is toolkit.api_wrapper
+
+
+def test_toolkits_with_same_credentials_share_wrapper():
+    a = AxioraToolkit(api_key="ax_test_key")
+    b = AxioraToolkit(api_key="ax_test_key")
+    c = AxioraToolkit(api_key="ax_other_key")
+    assert a.api_wrapper is b.api_wrapper
+    assert a.api_wrapper is not c.api_wrapper
+
+
+async def test_toolkit_warmup_pings_api_once():
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(503)
+
+    toolkit = AxioraToolkit(api_key="ax_test_key", warmup=True)
+    client = httpx.AsyncClient(base_url=DEFAULT_BASE_URL, transport=httpx.MockTransport(handler))
+    with patch.object(
+        AxioraAPIWrapper, "async_client", new_callable=PropertyMock, return_value=client
+    ):
+        toolkit.get_tools()
+        toolkit.get_tools()
+        await toolkit._warmup_task
+    assert seen == ["/v1/health"]
+
+
+def test_toolkit_reads_env_var(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("AXIORA_API_KEY", "ax_from_env")
+    tools = AxioraToolkit().get_tools()
+    assert len(tools) == 18
 
 
 # ---------------------------------------------------------------------------
@@ -76,17 +137,31 @@ def test_tool_init_with_api_key_directly():
     assert tool.api.api_key.get_secret_value() == "ax_direct_key"
 
 
+def test_tools_with_same_credentials_share_wrapper():
+    a = GetFinancialsTool(api_key="ax_direct_key")
+    b = SearchCompaniesTool(api_key="ax_direct_key")
+    c = SearchCompaniesTool(api_key="ax_direct_key", base_url="https://staging.axiora.dev/v1")
+    assert a.api is b.api
+    assert a.api is not c.api
+
+
+def test_tool_init_with_base_url():
+    tool = GetFinancialsTool(api_key="ax_direct_key", base_url="https://staging.axiora.dev/v1")
+    assert tool.api.base_url == "https://staging.axiora.dev/v1"
+    assert "base_url" not in tool.model_dump()
+
+
 def test_tool_init_with_wrapper(api: AxioraAPIWrapper):
     """Users can pass a shared wrapper."""
     tool = GetFinancialsTool(api=api)
     assert tool.api is api
 
 
-def test_tool_init_from_env():
+def test_tool_init_from_env(monkeypatch: pytest.MonkeyPatch):
     """Tools auto-read AXIORA_API_KEY from env."""
-    with patch.dict(os.environ, {"AXIORA_API_KEY": "ax_env_key"}):
-        tool = GetFinancialsTool()
-        assert tool.api.api_key.get_secret_value() == "ax_env_key"
+    monkeypatch.setenv("AXIORA_API_KEY", "ax_env_key")
+    tool = GetFinancialsTool()
+    assert tool.api.api_key.get_secret_value() == "ax_env_key"
 
 
 # ---------------------------------------------------------------------------
@@ -94,31 +169,72 @@ def test_tool_init_from_env():
 # ---------------------------------------------------------------------------
 
 
-def test_tool_has_correct_metadata():
-    tool = SearchCompaniesTool(api_key="ax_test")
+def test_tool_has_correct_metadata(toolkit_tools: list[BaseTool]):
+    tool = next(t for t in toolkit_tools if isinstance(t, SearchCompaniesTool))
     assert tool.name == "axiora_search_companies"
     assert "Japanese" in tool.description
     assert tool.args_schema is not None
     assert tool.handle_tool_error is True
 
 
-def test_all_tools_have_args_schema():
-    """Every tool except GetCoverage has an args_schema."""
-    from langchain_axiora.tools import GetCoverageTool
+@pytest.mark.parametrize("tool_cls", ALL_TOOLS, ids=lambda cls: cls.__name__)
+def test_tool_metadata(tool_cls: type[BaseTool], toolkit_tools: list[BaseTool]):
+    """Prefix, error handling, sync + async, and an args_schema (except GetCoverage)."""
+    tool = next(t for t in toolkit_tools if type(t) is tool_cls)
+    assert tool.name.startswith("axiora_")
+    assert tool.handle_tool_error is True
+    assert hasattr(tool_cls, "_run")
+    assert hasattr(tool_cls, "_arun")
+    assert (tool.args_schema is None) == (tool_cls in _TOOLS_WITHOUT_SCHEMA)
+
+
+def test_closed_value_sets_are_validated_locally():
+    assert GetRankingInput.model_json_schema()["properties"]["order"]["enum"] == ["desc", "asc"]
+    with pytest.raises(ValidationError):
+        GetRankingInput(metric="market_cap")
+    with pytest.raises(ValidationError):
+        ListFilingsInput(doc_type="999")
+
+
+def test_tool_without_endpoint_cannot_be_instantiated():
+    class NoEndpointTool(tools._AxioraBaseTool):
+        name: str = "no_endpoint"
+        description: str = "Missing _endpoint."
+
+    with pytest.raises(TypeError, match="_endpoint"):
+        NoEndpointTool(api_key="ax_test_key")
+
+
+@pytest.mark.parametrize(
+    ("schema", "kwargs"),
+    [
+        ("SearchCompaniesInput", {"query": "Toyota", "limit": 51}),
+        ("GetFinancialsInput", {"code": "7203", "years": 0}),
+        ("CompareCompaniesInput", {"codes": ["7203"]}),
+        ("CompareCompaniesInput", {"codes": ["7203", "7203"]}),
+        ("GetTimeseriesInput", {"codes": ["1", "2", "3", "4", "5", "6"]}),
+        ("SearchCompaniesBatchInput", {"queries": []}),
+        ("GetFilingCalendarInput", {"month": "June 2025"}),
+    ],
+)
+def test_documented_limits_are_enforced(schema: str, kwargs: dict):
+    with pytest.raises(ValidationError):
+        getattr(tools, schema)(**kwargs)
+
 
-    for tool_cls in ALL_TOOLS:
-        tool = tool_cls(api_key="ax_test")
-        assert tool.name.startswith("axiora_"), f"{tool.name} missing prefix"
-        assert tool.handle_tool_error is True, f"{tool.name} missing handle_tool_error"
-        if tool_cls is not GetCoverageTool:
-            assert tool.args_schema is not None, f"{tool.name} missing args_schema"
+def test_repeated_codes_count_once():
+    codes = ["7203", "6758", "7203", "1", "2", "3"]
+    assert tools.GetTimeseriesInput(codes=codes).codes == ["7203", "6758", "1", "2", "3"]
 
 
-def test_all_tools_have_async():
-    """Every tool implements both _run and _arun."""
-    for tool_cls in ALL_TOOLS:
-        assert hasattr(tool_cls, "_run"), f"{tool_cls.__name__} missing _run"
-        assert hasattr(tool_cls, "_arun"), f"{tool_cls.__name__} missing _arun"
+def test_invalid_arguments_come_back_as_a_message():
+    seen: list[httpx.Request] = []
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=_mock_transport({}, seen=seen))
+    result = GetRankingTool(api=api).invoke({"metric": "market_cap", "limit": 500})
+    assert result.startswith("Invalid arguments.")
+    assert "metric: Input should be 'revenue'" in result
+    assert "limit: Input should be less than or equal to 100" in result
+    assert not seen
 
 
 # ---------------------------------------------------------------------------
@@ -126,81 +242,184 @@ def test_all_tools_have_async():
 # ---------------------------------------------------------------------------
 
 
-def _mock_sync_client(response_json: dict) -> MagicMock:
-    """Create a mock httpx client that returns response_json."""
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.raise_for_status = MagicMock()
-    mock_resp.json.return_value = response_json
+def _mock_transport(
+    body: dict, status: int = 200, seen: list[httpx.Request] | None = None
+) -> httpx.MockTransport:
+    """Create a transport that answers every request with ``body``."""
 
-    mock_client = MagicMock()
-    mock_client.request.return_value = mock_resp
-    return mock_client
+    def handler(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        return httpx.Response(status, json=body)
 
+    return httpx.MockTransport(handler)
 
-def test_search_companies_calls_api(api: AxioraAPIWrapper):
-    mock_client = _mock_sync_client({"data": [{"name": "Toyota"}], "meta": {"total": 1}})
-    with patch.object(
-        type(api), "sync_client", new_callable=PropertyMock, return_value=mock_client
-    ):
-        tool = SearchCompaniesTool(api=api)
-        result = tool._run(query="Toyota")
-        assert "Toyota" in result
 
+def test_search_companies_calls_api():
+    transport = _mock_transport({"data": [{"name": "Toyota"}], "meta": {"total": 1}})
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=transport)
+    tool = SearchCompaniesTool(api=api)
+    result = tool._run(query="Toyota")
+    assert "Toyota" in result
 
-def test_get_company_calls_api(api: AxioraAPIWrapper):
-    mock_client = _mock_sync_client(
+
+def test_get_company_calls_api():
+    transport = _mock_transport(
         {"data": {"edinet_code": "E02144", "name_en": "Toyota"}, "meta": {}}
     )
-    with patch.object(
-        type(api), "sync_client", new_callable=PropertyMock, return_value=mock_client
-    ):
-        tool = GetCompanyTool(api=api)
-        result = tool._run(code="7203")
-        assert "E02144" in result
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=transport)
+    tool = GetCompanyTool(api=api)
+    result = tool._run(code="7203")
+    assert "E02144" in result
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "kwargs", "expected"),
+    [
+        ("axiora_get_sector_overview", {}, ("/sectors", None)),
+        ("axiora_get_sector_overview", {"sector": "電気機器"}, ("/sectors/電気機器", None)),
+        ("axiora_screen_companies", {"min_roe": 10.0}, ("/screen", {"min_roe": 10.0, "limit": 20})),
+        (
+            "axiora_compare_companies",
+            {"codes": ["7203", "6758", "7203"]},
+            ("/compare", {"codes": "6758,7203", "years": 3}),
+        ),
+        (
+            "axiora_get_timeseries",
+            {"codes": ["7203", "6758", "7203"]},
+            ("/timeseries", {"codes": "6758,7203", "metric": "revenue", "years": 10}),
+        ),
+        ("axiora_get_coverage", {}, ("/coverage", None)),
+    ],
+)
+def test_tool_endpoints(tool_name: str, kwargs: dict, expected: tuple):
+    tool_cls = next(cls for cls in ALL_TOOLS if cls.model_fields["name"].default == tool_name)
+    assert tool_cls(api_key="ax_test")._endpoint(**kwargs) == expected
 
 
-# ---------------------------------------------------------------------------
-# Error handling
-# ---------------------------------------------------------------------------
+def test_tool_results_follow_wrapper_cache():
+    seen: list[httpx.Request] = []
+    transport = _mock_transport({"data": [{"name": "Toyota"}]}, seen=seen)
+    api = AxioraAPIWrapper(api_key="ax_test_key", cache_ttl=0.05, transport=transport)
+    tool = SearchCompaniesTool(api=api)
+    tool._run(query="Toyota")
+    tool._run(query="Toyota")
+    assert len(seen) == 1
 
+    time.sleep(0.1)  # past the wrapper's cache_ttl
+    tool._run(query="Toyota")
+    assert len(seen) == 2
 
-def test_tool_raises_tool_exception_on_http_error(api: AxioraAPIWrapper):
-    mock_resp = MagicMock()
-    mock_resp.status_code = 404
-    mock_resp.json.return_value = {"detail": "Company not found"}
-    mock_resp.text = "Not Found"
+    api.clear_cache()
+    tool._run(query="Toyota")
+    assert len(seen) == 3
 
-    mock_client = MagicMock()
-    mock_client.request.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=MagicMock(), response=mock_resp
-    )
 
+def test_tool_results_cached_per_credentials():
+    seen: list[httpx.Request] = []
+    transport = _mock_transport({"data": {"name_en": "Toyota"}, "meta": {}}, seen=seen)
+    mock_client = httpx.Client(base_url=DEFAULT_BASE_URL, transport=transport)
     with patch.object(
-        type(api), "sync_client", new_callable=PropertyMock, return_value=mock_client
+        AxioraAPIWrapper, "sync_client", new_callable=PropertyMock, return_value=mock_client
     ):
-        tool = GetCompanyTool(api=api)
-        with pytest.raises(ToolException, match="404"):
-            tool._run(code="INVALID")
+        first = GetCompanyTool(api_key="ax_test_key")._run(code="7203")
+        again = GetCompanyTool(api_key="ax_test_key")._run(code="7203")
+        assert again == first
+        assert len(seen) == 1
+
+        GetCompanyTool(api_key="ax_other_key")._run(code="7203")
+        assert len(seen) == 2
+
+
+def test_tool_calls_survive_a_new_event_loop(keepalive_url: str):
+    """The shared wrapper's async pool isn't reused from an earlier, closed loop."""
+    first = GetCompanyTool(api_key="ax_test_key", base_url=keepalive_url)
+    second = GetCompanyTool(api_key="ax_test_key", base_url=keepalive_url)
+    assert first.api is second.api
+    assert "/companies/1" in asyncio.run(first.ainvoke({"code": "1"}))
+    assert "/companies/2" in asyncio.run(second.ainvoke({"code": "2"}))
+
+
+def test_concurrent_loops_each_keep_one_async_client():
+    api = AxioraAPIWrapper(api_key="ax_test_key", cache_ttl=0, transport=_mock_transport({}))
+    barrier = threading.Barrier(2)
+
+    async def calls(worker: int) -> set[int]:
+        barrier.wait()  # both loops are running from here on
+        clients = set()
+        for i in range(20):
+            clients.add(id(api.async_client))
+            await api.arequest("GET", f"/companies/{worker}-{i}")
+            await asyncio.sleep(0)
+        return clients
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, second = pool.map(lambda worker: asyncio.run(calls(worker)), range(2))
+    assert len(first) == len(second) == 1
+    assert first != second
+
+
+async def test_concurrent_tool_calls_share_one_request():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {"name_en": "Toyota"}})
+
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=httpx.MockTransport(handler))
+    tool = GetCompanyTool(api=api)
+    results = await asyncio.gather(*(tool._arun(code="7203") for _ in range(5)))
+    assert calls == 1
+    assert len(set(results)) == 1
+    assert not api._inflight
+    # Only the formatted result is cached, not the raw body as well.
+    assert len(api._cache) == 1
 
 
-def test_error_hint_for_401(api: AxioraAPIWrapper):
-    mock_resp = MagicMock()
-    mock_resp.status_code = 401
-    mock_resp.json.return_value = {"detail": "Unauthorized"}
-    mock_resp.text = "Unauthorized"
+# ---------------------------------------------------------------------------
+# Error handling
+# ---------------------------------------------------------------------------
 
-    mock_client = MagicMock()
-    mock_client.request.side_effect = httpx.HTTPStatusError(
-        "Unauthorized", request=MagicMock(), response=mock_resp
-    )
 
-    with patch.object(
-        type(api), "sync_client", new_callable=PropertyMock, return_value=mock_client
-    ):
-        tool = GetCompanyTool(api=api)
-        with pytest.raises(ToolException, match="AXIORA_API_KEY"):
-            tool._run(code="7203")
+@pytest.mark.parametrize(
+    ("status", "detail", "match"),
+    [
+        (404, "Company not found", "404. Company not found"),
+        (401, "Unauthorized", "AXIORA_API_KEY"),
+        (429, "Too many requests", "Rate limit exceeded"),
+        (503, "Service unavailable", "503. Service unavailable"),
+    ],
+)
+def test_tool_raises_tool_exception_on_http_error(status: int, detail: str, match: str):
+    transport = _mock_transport({"detail": detail}, status=status)
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=transport)
+    tool = GetCompanyTool(api=api)
+    with pytest.raises(ToolException, match=match):
+        tool._run(code="7203")
+
+
+@pytest.mark.parametrize(
+    ("status", "body", "expected"),
+    [
+        (
+            404,
+            {"detail": "Company not found"},
+            "Axiora API error 404. Company not found. "
+            "Not found. Use axiora_search_companies to find the correct code.",
+        ),
+        (429, {}, "Axiora API error 429. Rate limit exceeded. Wait a moment before retrying."),
+        (500, {"error": "boom"}, "Axiora API error 500. boom"),
+    ],
+)
+def test_http_error_message(status: int, body: dict, expected: str):
+    request = httpx.Request("GET", f"{DEFAULT_BASE_URL}/coverage")
+    response = httpx.Response(status, json=body, request=request)
+    exc = httpx.HTTPStatusError("error", request=request, response=response)
+    with pytest.raises(ToolException) as info:
+        _handle_http_error(exc)
+    assert str(info.value) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -211,7 +430,32 @@ def test_error_hint_for_401(api: AxioraAPIWrapper):
 def test_api_wrapper_cleans_none_params():
     api = AxioraAPIWrapper(api_key="test")
     cleaned = api._clean({"a": 1, "b": None, "c": "hello"})
-    assert cleaned == {"a": 1, "c": "hello"}
+    assert cleaned == [("a", 1), ("c", "hello")]
+
+
+def test_tool_omits_none_params():
+    seen: list[httpx.Request] = []
+    transport = _mock_transport({"data": [], "meta": {}}, seen=seen)
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=transport)
+    tool = SearchCompaniesTool(api=api)
+    tool._run(query="Toyota")
+    tool._run(query="Toyota", sector=None)
+    assert len(seen) == 1
+    assert seen[0].url == f"{DEFAULT_BASE_URL}/companies/search?q=Toyota&limit=10"
+
+
+def test_api_wrapper_resolves_paths_against_base_url():
+    trailing = AxioraAPIWrapper(api_key="test", base_url="https://example.test/v1/")
+    request = trailing.sync_client.build_request("GET", "/coverage")
+    assert request.url == "https://example.test/v1/coverage"
+
+
+@pytest.mark.parametrize("http2", [True, False])
+def test_api_wrapper_http2_toggle(http2: bool):
+    api = AxioraAPIWrapper(api_key="test", http2=http2)
+    with patch.object(httpx, "HTTPTransport", wraps=httpx.HTTPTransport) as transport:
+        assert api.sync_client is not None
+    assert transport.call_args.kwargs["http2"] is http2
 
 
 def test_api_wrapper_secret_str():
@@ -220,50 +464,288 @@ def test_api_wrapper_secret_str():
     assert api.api_key.get_secret_value() == "ax_secret_key"
 
 
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_json_loads_backends(monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+    if not use_orjson:
+        monkeypatch.setattr(_json, "orjson", None)
+    assert _json.loads('{"name": "トヨタ", "roe": 9.5}'.encode()) == {"name": "トヨタ", "roe": 9.5}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_json_dumps_backends(monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+    if not use_orjson:
+        monkeypatch.setattr(_json, "orjson", None)
+    data = {"name": "トヨタ", 2024: datetime.date(2024, 3, 31), "big": 2**70}
+    assert json.loads(_json.dumps(data)) == {
+        "name": "トヨタ",
+        "2024": "2024-03-31",
+        "big": 2**70,
+    }
+
+
+def test_api_wrapper_caches_get_responses():
+    seen: list[httpx.Request] = []
+    transport = _mock_transport({"data": {"edinet_code": "E02144"}}, seen=seen)
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=transport)
+    first = api.request("GET", "/companies/7203", {"years": 5, "sector": None})
+    second = api.request("GET", "/companies/7203", {"sector": None, "years": 5})
+    api.request("GET", "/companies/7203", {"years": 3})
+    assert first == second
+    assert len(seen) == 2
+    # Each caller gets its own copy, so mutating one doesn't leak into the cache.
+    first["data"]["edinet_code"] = "changed"
+    assert api.request("GET", "/companies/7203", {"years": 5}) == second
+
+
+def test_api_wrapper_raises_on_error_status():
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=_mock_transport({}, status=429))
+    with pytest.raises(httpx.HTTPStatusError, match="429"):
+        api.request("GET", "/coverage")
+
+
+def test_api_wrapper_cache_disabled():
+    seen: list[httpx.Request] = []
+    api = AxioraAPIWrapper(
+        api_key="test", cache_ttl=0, transport=_mock_transport({"data": {}}, seen=seen)
+    )
+    api.request("GET", "/coverage")
+    api.request("GET", "/coverage")
+    assert len(seen) == 2
+
+
+async def test_api_wrapper_collapses_concurrent_identical_requests():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {}})
+
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=httpx.MockTransport(handler))
+    results = await asyncio.gather(*(api.arequest("GET", "/coverage") for _ in range(5)))
+    assert calls == 1
+    assert all(r == {"data": {}} for r in results)
+    assert not api._inflight
+
+
+async def test_api_wrapper_shares_one_failure_between_concurrent_requests():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(500, json={})
+
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=httpx.MockTransport(handler))
+    results = await asyncio.gather(
+        *(api.arequest("GET", "/coverage") for _ in range(5)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert not api._inflight
+
+
+async def test_api_wrapper_retrieves_failure_after_every_caller_cancels():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(500, json={})
+
+    errors: list[dict] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: errors.append(ctx))
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=httpx.MockTransport(handler))
+    caller = asyncio.ensure_future(api.arequest("GET", "/coverage"))
+    await asyncio.sleep(0.005)
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0.05)  # the shared task fails with nobody waiting
+    gc.collect()
+    assert not api._inflight
+    assert errors == []
+
+
+async def test_amap_request_bounds_concurrency():
+    active = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=httpx.MockTransport(handler))
+    calls = [("GET", f"/companies/{code}", None) for code in range(6)]
+    results = await api.amap_request(calls, concurrency=2)
+    assert [r["path"] for r in results] == [f"/v1/companies/{code}" for code in range(6)]
+    assert peak == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+async def test_coverage_tool_revalidates_with_etag(use_async: bool):
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": {"companies": 4000}}, headers={"ETag": '"v1"'})
+
+    api = AxioraAPIWrapper(
+        api_key="ax_test_key", cache_ttl=0, transport=httpx.MockTransport(handler)
+    )
+    tool = GetCoverageTool(api=api)
+
+    async def call() -> str:
+        return await tool._arun() if use_async else tool._run()
+
+    first, second = await call(), await call()
+    assert first == second == '{"data":{"companies":4000}}'
+    assert seen == [None, '"v1"']
+
+
+async def test_concurrent_coverage_calls_share_one_request():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {"companies": 4000}}, headers={"ETag": '"v1"'})
+
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=httpx.MockTransport(handler))
+    tool = GetCoverageTool(api=api)
+    results = await asyncio.gather(*(tool._arun() for _ in range(5)))
+    assert calls == 1
+    assert set(results) == {'{"data":{"companies":4000}}'}
+    assert not api._inflight
+
+
+def test_api_wrapper_transport_backs_both_clients():
+    transport = _mock_transport({})
+    api = AxioraAPIWrapper(api_key="ax_test_key", transport=transport)
+    assert api.sync_client._transport is transport
+    assert api.async_client._transport is transport
+    assert "transport" not in api.model_dump()
+
+
+def test_api_wrapper_context_manager_closes_client():
+    with AxioraAPIWrapper(api_key="test") as api:
+        client = api.sync_client
+    assert client.is_closed
+    assert api._sync_client is None
+
+
+async def test_api_wrapper_async_context_manager_closes_clients():
+    async with AxioraAPIWrapper(api_key="test") as api:
+        aclient = api.async_client
+        client = api.sync_client
+    assert aclient.is_closed
+    assert client.is_closed
+
+
 # ---------------------------------------------------------------------------
 # Retriever
 # ---------------------------------------------------------------------------
 
 
 def test_retriever_init():
-    from langchain_axiora import AxioraRetriever
-
     retriever = AxioraRetriever(api_key="ax_test")
     assert retriever.k == 10
     assert retriever.section is None
 
 
 def test_retriever_with_section():
-    from langchain_axiora import AxioraRetriever
-
     retriever = AxioraRetriever(api_key="ax_test", section="risk_factors", k=5)
     assert retriever.section == "risk_factors"
     assert retriever.k == 5
 
 
-def test_retriever_to_documents():
-    from langchain_axiora.retriever import AxioraRetriever
-
-    result = {
-        "data": [
-            {
-                "content": "Semiconductor supply chain risks...",
-                "company_name": "Toyota",
-                "doc_id": "S100ABCD",
-                "section": "risk_factors",
-            },
-            {
-                "content": "Foreign exchange fluctuation...",
-                "company_name": "Honda",
-                "doc_id": "S100EFGH",
-                "section": "risk_factors",
-            },
-        ],
-        "meta": {"total": 2},
-    }
-    docs = AxioraRetriever._to_documents(result)
-    assert len(docs) == 2
-    assert docs[0].page_content == "Semiconductor supply chain risks..."
-    assert docs[0].metadata["company_name"] == "Toyota"
-    assert docs[0].metadata["doc_id"] == "S100ABCD"
-    assert "content" not in docs[0].metadata
+def test_retriever_shares_wrapper_with_toolkit():
+    toolkit = AxioraToolkit(api_key="ax_test_key")
+    retriever = AxioraRetriever(api_key="ax_test_key")
+    assert retriever._wrapper is toolkit.api_wrapper
+
+
+def test_toolkit_and_retriever_survive_a_new_event_loop(keepalive_url: str):
+    toolkit = AxioraToolkit(api_key="ax_test_key", base_url=keepalive_url)
+    retriever = AxioraRetriever(api_key="ax_test_key", base_url=keepalive_url)
+    assert retriever._wrapper is toolkit.api_wrapper
+    tool = next(t for t in toolkit.get_tools() if isinstance(t, SearchCompaniesTool))
+    assert "/companies/search" in asyncio.run(tool.ainvoke({"query": "Toyota"}))
+    docs = asyncio.run(retriever.ainvoke("semiconductor"))
+    assert docs[0].page_content.startswith("/translations/search")
+
+
+def test_retriever_uses_injected_wrapper(
+    monkeypatch: pytest.MonkeyPatch, api: AxioraAPIWrapper
+):
+    monkeypatch.delenv("AXIORA_API_KEY", raising=False)
+    retriever = AxioraRetriever(api_wrapper=api)
+    assert retriever._wrapper is api
+    assert retriever.api_key.get_secret_value() == "ax_test_key"
+    assert "api_wrapper" not in retriever.model_dump()
+
+
+def test_make_shared_binds_one_wrapper():
+    api, retriever, toolkit = make_shared(api_key="ax_shared_key")
+    assert retriever._wrapper is api
+    assert all(tool.api is api for tool in toolkit.get_tools())
+
+
+def test_retriever_item_to_doc():
+    doc = AxioraRetriever._item_to_doc(
+        {
+            "content": "Semiconductor supply chain risks...",
+            "company_name": "Toyota",
+            "doc_id": "S100ABCD",
+            "section": "risk_factors",
+        }
+    )
+    assert doc.page_content == "Semiconductor supply chain risks..."
+    assert doc.metadata["company_name"] == "Toyota"
+    assert doc.metadata["doc_id"] == "S100ABCD"
+    assert "content" not in doc.metadata
+
+
+def test_retriever_item_to_doc_content_fallbacks():
+    items = [{"content": None, "snippet": "only a snippet"}, {"doc_id": "S100"}]
+    docs = [AxioraRetriever._item_to_doc(item) for item in items]
+    assert [d.page_content for d in docs] == ["only a snippet", ""]
+
+
+_SEARCH_BODY = {
+    "data": [
+        {"content": "Semiconductor supply chain risks...", "company_name": "Toyota"},
+        {"snippet": "Foreign exchange...", "company_name": "Honda", "doc_id": None},
+    ],
+    "meta": {"total": 2},
+}
+
+
+@pytest.mark.parametrize("use_ijson", [True, False], ids=["ijson", "buffered"])
+def test_retriever_streams_documents(monkeypatch: pytest.MonkeyPatch, use_ijson: bool):
+    if not use_ijson:
+        monkeypatch.setattr(api_wrapper, "ijson", None)
+    elif api_wrapper.ijson is None:
+        pytest.skip("ijson not installed")
+    api = AxioraAPIWrapper(api_key="ax_test", transport=_mock_transport(_SEARCH_BODY))
+    docs = AxioraRetriever(api_wrapper=api).invoke("semiconductor")
+    assert [d.page_content for d in docs] == [
+        "Semiconductor supply chain risks...",
+        "Foreign exchange...",
+    ]
+    assert docs[1].metadata == {"company_name": "Honda"}
+
+
+def test_retriever_returns_empty_for_null_data():
+    api = AxioraAPIWrapper(api_key="ax_test", transport=_mock_transport({"data": None}))
+    assert AxioraRetriever(api_wrapper=api).invoke("semiconductor") == []
+
+
+async def test_retriever_async_returns_empty_on_http_error():
+    api = AxioraAPIWrapper(api_key="ax_test", transport=_mock_transport({}, status=500))
+    assert await AxioraRetriever(api_wrapper=api).ainvoke("semiconductor") == []